@@ -3,13 +3,147 @@
 Catalog analyzer tool - parses the output directory and generates structured data
 for creating reference documents about the municipal website.
 """
-import json
+import functools
+import heapq
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Tuple
 import re
 
+import ahocorasick
+import numpy as np
+import orjson
+
+from topic_matcher import NUMBA_AVAILABLE, TopicMatcher
+
+# Optional: compressed sidecar for archival copies of the analysis
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Topics and the keywords that signal them on a page
+TOPIC_KEYWORDS = {
+    'parking': ['parking', 'permit', 'garage'],
+    'taxes': ['tax', 'property tax', 'assessment'],
+    'permits': ['permit', 'license', 'application'],
+    'utilities': ['water', 'sewer', 'utility', 'billing'],
+    'public_safety': ['police', 'fire', 'emergency', 'safety'],
+    'development': ['development', 'building', 'construction', 'zoning'],
+    'recreation': ['park', 'recreation', 'library', 'event'],
+    'public_works': ['street', 'road', 'infrastructure', 'public works'],
+    'elections': ['election', 'voting', 'voter', 'ballot'],
+    'business': ['business', 'commercial', 'economic development']
+}
+
+
+def _build_topic_automaton() -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton over all topic keywords.
+
+    A single pass over the page text then yields every keyword hit at once,
+    instead of one substring scan per keyword per topic. Keywords shared by
+    several topics (e.g. 'permit') map to a tuple of all their topics.
+    """
+    keyword_topics = defaultdict(list)
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_topics[keyword].append(topic)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, topics in keyword_topics.items():
+        automaton.add_word(keyword, tuple(topics))
+    automaton.make_automaton()
+    return automaton
+
+
+_TOPIC_AUTOMATON = _build_topic_automaton()
+
+# Below this page count the JIT warmup outweighs the batch kernel win,
+# so small catalogs stay on the pyahocorasick path
+_NUMBA_MIN_PAGES = 512
+
+# Page files above this size are memory-mapped instead of read into an
+# intermediate bytes object; orjson parses straight from the buffer
+_MMAP_THRESHOLD = 1 << 20
+
+
+@functools.lru_cache(maxsize=4096)
+def _section_from_url(url: str, base_url: str) -> Tuple[str, str]:
+    """Derive (section, path) from a page URL.
+
+    Memoized: the same URL prefixes recur across the catalog, so repeat
+    lookups skip the replace/split/title work.
+    """
+    parsed_url = url.replace(base_url, '').replace('https://www.oak-park.us', '')
+    path_parts = [p for p in parsed_url.split('/') if p]
+
+    if path_parts:
+        section = path_parts[0].title().replace('-', ' ')
+    else:
+        section = 'Home'
+
+    return section, parsed_url
+
+
+def _page_has_pdf(page: Dict) -> bool:
+    """Read the PDF flag precomputed by the cleaner, falling back to a
+    links scan for catalogs written before the flag existed."""
+    flag = page.get('has_pdfs')
+    if flag is None:
+        flag = any(link['type'] == 'pdf' for link in page.get('links', []))
+    return flag
+
+
+def _load_page(page_file: Path) -> Dict:
+    """Parse a page file and cache the lowercase text forms on the dict.
+
+    Lowercasing multi-KB content strings allocates a fresh object per call,
+    so do it once at load time instead of in every consumer.
+    """
+    if page_file.stat().st_size > _MMAP_THRESHOLD:
+        with open(page_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                page = orjson.loads(memoryview(mapped))
+    else:
+        page = orjson.loads(page_file.read_bytes())
+    page['_content_lower'] = page.get('content_text', '').lower()
+    page['_title_lower'] = page['title'].lower()
+    return page
+
+# PDF categories and the keywords that route a PDF into them.
+# Order matters: earlier categories win when several keywords match.
+PDF_CATEGORY_KEYWORDS = {
+    'meeting_minutes': ['minutes', 'agenda', 'meeting'],
+    'ordinances': ['ordinance', 'resolution'],
+    'financial': ['budget', 'financial', 'audit', 'fiscal', 'finance'],
+    'planning': ['planning', 'zoning', 'development', 'comprehensive plan'],
+    'reports': ['report', 'annual', 'quarterly', 'study'],
+    'notices': ['notice', 'notification', 'announcement'],
+    'policies': ['policy', 'protocol', 'procedure', 'guideline'],
+    'memos': ['memo', 'memorandum']
+}
+
+# Single-word keywords route via O(1) token-set intersection, which is
+# also more precise than substring checks ('memorial' no longer matches
+# 'memo'); the few multi-word keywords keep a substring scan.
+_WORD_RE = re.compile(r'[a-z]+')
+_CATEGORY_PRIORITY = {category: i for i, category in enumerate(PDF_CATEGORY_KEYWORDS)}
+_SINGLE_WORD_CATEGORIES = {
+    keyword: category
+    for category, keywords in PDF_CATEGORY_KEYWORDS.items()
+    for keyword in keywords if ' ' not in keyword
+}
+_MULTI_WORD_KEYWORDS = [
+    (category, keyword)
+    for category, keywords in PDF_CATEGORY_KEYWORDS.items()
+    for keyword in keywords if ' ' in keyword
+]
+
 
 class CatalogAnalyzer:
     def __init__(self, output_dir: str = 'output'):
@@ -21,73 +155,125 @@ class CatalogAnalyzer:
         self.pages = []
         self.pdfs = []
 
+        # Column arrays over the pages, built once in load_data so the
+        # statistics reduce to vectorized NumPy calls
+        self._word_counts = None
+        self._has_pdf = None
+
     def load_data(self):
         """Load all data from the catalog."""
         print("Loading catalog data...")
 
         # Load metadata
-        with open(self.output_dir / 'site_metadata.json', 'r') as f:
-            self.metadata = json.load(f)
+        self.metadata = orjson.loads((self.output_dir / 'site_metadata.json').read_bytes())
 
-        # Load all pages
+        # Load all pages in parallel; the GIL is released around the
+        # OS read and the orjson parse, so threads scale here
         page_files = list(self.pages_dir.glob('*.json'))
         print(f"Loading {len(page_files)} pages...")
-        for page_file in page_files:
-            with open(page_file, 'r') as f:
-                self.pages.append(json.load(f))
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self.pages = list(executor.map(_load_page, page_files))
+
+        # Column arrays for the statistics pass
+        page_count = len(self.pages)
+        self._word_counts = np.fromiter(
+            (p.get('word_count', 0) for p in self.pages), dtype=np.int64, count=page_count
+        )
+        self._has_pdf = np.fromiter(
+            (_page_has_pdf(p) for p in self.pages), dtype=bool, count=page_count
+        )
 
         # Load PDFs
-        with open(self.pdfs_dir / 'catalog.json', 'r') as f:
-            pdf_data = json.load(f)
-            self.pdfs = pdf_data.get('pdfs', [])
+        pdf_data = orjson.loads((self.pdfs_dir / 'catalog.json').read_bytes())
+        self.pdfs = pdf_data.get('pdfs', [])
 
         print(f"Loaded {len(self.pages)} pages and {len(self.pdfs)} PDFs")
 
-    def extract_sections(self) -> Dict[str, List[Dict]]:
-        """Extract main sections/departments from URLs and page titles."""
-        sections = defaultdict(list)
+    def analyze_pages(self) -> Tuple[Dict[str, List[Dict]], Dict[str, List[Dict]]]:
+        """Walk the pages once, building sections and topic hits together
+        instead of in separate full passes.
+
+        Returns (sections, topic_pages).
+        """
+        section_rows = []  # flat (section, summary) pairs, grouped after the pass
+        topic_pages = defaultdict(list)
+        topic_seen = defaultdict(set)
 
-        for page in self.pages:
+        base_url = self.metadata['base_url']
+
+        # On big catalogs, batch all topic matching through the parallel
+        # numba kernel up front; otherwise match per page below
+        batched_hits = None
+        if NUMBA_AVAILABLE and len(self.pages) >= _NUMBA_MIN_PAGES:
+            matcher = TopicMatcher(TOPIC_KEYWORDS)
+            batched_hits = matcher.match(
+                [p['_content_lower'] + ' ' + p['_title_lower'] for p in self.pages]
+            )
+
+        for index, page in enumerate(self.pages):
             url = page['url']
             title = page['title']
+            word_count = page.get('word_count', 0)
+            links = page.get('links', [])
 
             # Parse URL path to extract section
-            parsed_url = url.replace(self.metadata['base_url'], '').replace('https://www.oak-park.us', '')
-            path_parts = [p for p in parsed_url.split('/') if p]
-
-            if path_parts:
-                section = path_parts[0].title().replace('-', ' ')
-            else:
-                section = 'Home'
+            section, parsed_url = _section_from_url(url, base_url)
 
-            sections[section].append({
+            section_rows.append((section, {
                 'url': url,
                 'title': title,
-                'word_count': page.get('word_count', 0),
+                'word_count': word_count,
                 'headings': page.get('headings', []),
-                'links': page.get('links', []),
+                'links': links,
+                'has_pdfs': _page_has_pdf(page),
                 'path': parsed_url
-            })
+            }))
+
+            # One automaton pass yields every keyword hit for all topics
+            if batched_hits is not None:
+                topic_hits = batched_hits[index]
+            else:
+                combined = page['_content_lower'] + ' ' + page['_title_lower']
+                topic_hits = set()
+                for _, topics in _TOPIC_AUTOMATON.iter(combined):
+                    topic_hits.update(topics)
+
+            # Deduplicate and limit inline: top 10 unique pages per topic
+            for topic in topic_hits:
+                if len(topic_pages[topic]) >= 10 or url in topic_seen[topic]:
+                    continue
+                topic_seen[topic].add(url)
+                topic_pages[topic].append({
+                    'title': title,
+                    'url': url
+                })
+
+        # Group the flat section column in one stable sort + groupby instead
+        # of a per-page dict lookup and append
+        section_rows.sort(key=itemgetter(0))
+        sections = {
+            section: [summary for _, summary in rows]
+            for section, rows in groupby(section_rows, key=itemgetter(0))
+        }
 
-        return dict(sections)
+        return sections, dict(topic_pages)
 
     def identify_key_pages(self, sections: Dict) -> List[Dict]:
         """Identify key/important pages based on various factors."""
         key_pages = []
 
         for section, pages_list in sections.items():
-            # Sort pages by word count (indicator of content richness)
-            sorted_pages = sorted(pages_list, key=lambda p: p['word_count'], reverse=True)
-
-            # Take top pages from each section
-            for page in sorted_pages[:5]:  # Top 5 per section
+            # Top 5 pages by word count (indicator of content richness);
+            # nlargest avoids sorting the whole section
+            for page in heapq.nlargest(5, pages_list, key=lambda p: p['word_count']):
                 if page['word_count'] > 100:  # Only pages with substantial content
                     key_pages.append({
                         'section': section,
                         'title': page['title'],
                         'url': page['url'],
                         'word_count': page['word_count'],
-                        'has_pdfs': any(link['type'] == 'pdf' for link in page['links'])
+                        'has_pdfs': page['has_pdfs']
                     })
 
         # Sort by word count globally
@@ -98,86 +284,34 @@ class CatalogAnalyzer:
         """Categorize PDFs based on title and parent page."""
         categories = defaultdict(list)
 
-        keywords = {
-            'meeting_minutes': ['minutes', 'agenda', 'meeting'],
-            'ordinances': ['ordinance', 'resolution'],
-            'financial': ['budget', 'financial', 'audit', 'fiscal', 'finance'],
-            'planning': ['planning', 'zoning', 'development', 'comprehensive plan'],
-            'reports': ['report', 'annual', 'quarterly', 'study'],
-            'notices': ['notice', 'notification', 'announcement'],
-            'policies': ['policy', 'protocol', 'procedure', 'guideline'],
-            'memos': ['memo', 'memorandum']
-        }
-
         for pdf in self.pdfs:
-            title_lower = pdf['title'].lower()
-            parent_lower = pdf.get('parent_page', '').lower()
-            combined_text = title_lower + ' ' + parent_lower
-
-            categorized = False
-            for category, keyword_list in keywords.items():
-                if any(keyword in combined_text for keyword in keyword_list):
-                    categories[category].append(pdf)
-                    categorized = True
-                    break
-
-            if not categorized:
-                categories['other'].append(pdf)
+            combined_text = (pdf['title'] + ' ' + pdf.get('parent_page', '')).lower()
+
+            # One hash intersection replaces the per-keyword substring
+            # scans; multi-word keywords still need a substring check and
+            # compete on equal footing so category priority holds even
+            # when both kinds of keyword match
+            tokens = _WORD_RE.findall(combined_text)
+            hits = set(tokens) & _SINGLE_WORD_CATEGORIES.keys()
+            candidates = [_SINGLE_WORD_CATEGORIES[token] for token in hits]
+            candidates.extend(
+                cat for cat, keyword in _MULTI_WORD_KEYWORDS if keyword in combined_text
+            )
+            category = min(candidates, key=_CATEGORY_PRIORITY.get, default='other')
+            categories[category].append(pdf)
 
         return dict(categories)
 
-    def find_common_topics(self) -> Dict[str, List[str]]:
-        """Find common topics and what pages contain them."""
-        topic_keywords = {
-            'parking': ['parking', 'permit', 'garage'],
-            'taxes': ['tax', 'property tax', 'assessment'],
-            'permits': ['permit', 'license', 'application'],
-            'utilities': ['water', 'sewer', 'utility', 'billing'],
-            'public_safety': ['police', 'fire', 'emergency', 'safety'],
-            'development': ['development', 'building', 'construction', 'zoning'],
-            'recreation': ['park', 'recreation', 'library', 'event'],
-            'public_works': ['street', 'road', 'infrastructure', 'public works'],
-            'elections': ['election', 'voting', 'voter', 'ballot'],
-            'business': ['business', 'commercial', 'economic development']
-        }
-
-        topic_pages = defaultdict(list)
-
-        for page in self.pages:
-            content = page.get('content_text', '').lower()
-            title = page['title'].lower()
-            combined = content + ' ' + title
-
-            for topic, keywords in topic_keywords.items():
-                if any(keyword in combined for keyword in keywords):
-                    topic_pages[topic].append({
-                        'title': page['title'],
-                        'url': page['url']
-                    })
-
-        # Deduplicate and limit
-        for topic in topic_pages:
-            seen = set()
-            unique = []
-            for page in topic_pages[topic]:
-                if page['url'] not in seen:
-                    seen.add(page['url'])
-                    unique.append(page)
-            topic_pages[topic] = unique[:10]  # Top 10 per topic
-
-        return dict(topic_pages)
-
     def get_statistics(self) -> Dict:
         """Get overall statistics about the site."""
-        total_words = sum(p.get('word_count', 0) for p in self.pages)
-        pages_with_pdfs = sum(1 for p in self.pages if any(link['type'] == 'pdf' for link in p.get('links', [])))
+        total_words = int(self._word_counts.sum())
 
         return {
             'total_pages': len(self.pages),
             'total_pdfs': len(self.pdfs),
             'total_words': total_words,
             'avg_words_per_page': total_words // len(self.pages) if self.pages else 0,
-            'pages_with_pdfs': pages_with_pdfs,
+            'pages_with_pdfs': int(self._has_pdf.sum()),
             'base_url': self.metadata.get('base_url', ''),
             'crawl_date': self.metadata.get('crawl_completed', '')
         }
@@ -186,8 +320,8 @@ class CatalogAnalyzer:
         """Generate comprehensive analysis of the catalog."""
         self.load_data()
 
-        print("\nAnalyzing catalog structure...")
-        sections = self.extract_sections()
+        print("\nAnalyzing pages...")
+        sections, topic_pages = self.analyze_pages()
 
         print("Identifying key pages...")
         key_pages = self.identify_key_pages(sections)
@@ -195,9 +329,6 @@ class CatalogAnalyzer:
         print("Categorizing PDFs...")
         pdf_categories = self.categorize_pdfs()
 
-        print("Finding common topics...")
-        topic_pages = self.find_common_topics()
-
         print("Calculating statistics...")
         stats = self.get_statistics()
 
@@ -209,9 +340,14 @@ class CatalogAnalyzer:
             'topic_pages': topic_pages
         }
 
-        # Save analysis to file
-        with open(self.output_dir / 'analysis.json', 'w') as f:
-            json.dump(analysis, f, indent=2, default=str)
+        # Save analysis to file, plus a compressed sidecar for cold
+        # storage when zstandard is available
+        payload = orjson.dumps(analysis, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+        (self.output_dir / 'analysis.json').write_bytes(payload)
+        if zstandard is not None:
+            (self.output_dir / 'analysis.json.zst').write_bytes(
+                zstandard.ZstdCompressor(level=3).compress(payload)
+            )
 
         print(f"\n✓ Analysis complete! Saved to {self.output_dir / 'analysis.json'}")
         return analysis
@@ -221,6 +357,14 @@ def main():
     analyzer = CatalogAnalyzer()
     analysis = analyzer.generate_analysis()
 
+    # Build the reference documents from the in-memory analysis rather
+    # than re-parsing analysis.json in each generator script
+    print("\nGenerating reference documents...")
+    from generate_complete_index import build_complete_index
+    from generate_document_catalog import build_document_catalog
+    build_complete_index(analysis)
+    build_document_catalog(analysis)
+
     print("\n" + "=" * 60)
     print("CATALOG ANALYSIS SUMMARY")
     print("=" * 60)
@@ -2,10 +2,32 @@
 HTML content cleaner for extracting main content and removing boilerplate.
 Uses heuristics and common patterns without LLM assistance.
 """
-from bs4 import BeautifulSoup, NavigableString
-from typing import List, Dict, Set
+import functools
+import gzip
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
+from lxml import html as lhtml
+from lxml.cssselect import CSSSelector
+from typing import List, Dict, Optional, Set
 import re
 
+def _page_html(page: Dict) -> str:
+    """Return a page's raw HTML, reloading from disk when streamed out.
+
+    The scraper drops HTML from memory after writing it to a gzip
+    sidecar and leaves an html_file pointing at it, so only one page's
+    HTML is resident at a time during cleaning.
+    """
+    html = page.get('html')
+    if html is not None:
+        return html
+    html_file = page.get('html_file')
+    if not html_file:
+        return ''
+    with gzip.open(html_file, 'rb') as f:
+        return f.read().decode('utf-8', errors='replace')
+
 
 class ContentCleaner:
     # Common boilerplate CSS selectors to remove
@@ -38,22 +60,60 @@ class ContentCleaner:
         '#content', '#main-content', '#main'
     ]
 
+    # Selectors are compiled once at class load; the hot loops then run
+    # entirely inside lxml's C-level evaluators
+    _BOILERPLATE_SELECTOR = CSSSelector(', '.join(BOILERPLATE_SELECTORS))
+    _CONTENT_SELECTOR_LIST = [CSSSelector(s) for s in CONTENT_SELECTORS]
+
+    # Regexes likewise compile once at class load; re's internal cache is
+    # small and keyed by pattern+flags, so don't rely on it in hot loops.
+    # The boilerplate patterns fuse into one alternation so each fragment
+    # costs a single scan
+    _BOILERPLATE_RE = re.compile('|'.join(f'(?:{p})' for p in BOILERPLATE_PATTERNS), re.IGNORECASE)
+    _DISPLAY_NONE_RE = re.compile(r'display:\s*none')
+    _DEPARTMENT_RE = re.compile(r'(department|category|section)')
+    _DATE_CLASS_RE = re.compile(r'(date|published|updated)')
+    _DATE_VALUE_RE = re.compile(r'\b(\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b')
+    _DOC_TYPE_RE = re.compile(r'(document-type|doc-type|type)')
+
     def __init__(self):
         self.boilerplate_fragments: Set[str] = set()
 
+    @staticmethod
+    def _parse_html(html: str) -> Optional[lhtml.HtmlElement]:
+        """Parse HTML into an lxml tree, returning None for empty/broken input."""
+        if not html or not html.strip():
+            return None
+        try:
+            return lhtml.fromstring(html)
+        except (etree.ParserError, ValueError):
+            return None
+
+    @staticmethod
+    def _element_text(element) -> str:
+        """Get an element's text content with whitespace normalized."""
+        return ' '.join(''.join(element.itertext()).split())
+
     def clean_page(self, html: str, url: str) -> Dict:
         """
         Clean a single page's HTML and extract structured content.
 
         Returns a dict with cleaned text, headings, and metadata.
         """
-        soup = BeautifulSoup(html, 'lxml')
+        tree = self._parse_html(html)
+        if tree is None:
+            return {
+                'content_text': '',
+                'headings': [],
+                'metadata': {},
+                'word_count': 0
+            }
 
         # Remove boilerplate elements
-        self._remove_boilerplate(soup)
+        self._remove_boilerplate(tree)
 
         # Extract main content area
-        main_content = self._extract_main_content(soup)
+        main_content = self._extract_main_content(tree)
 
         # Extract headings hierarchy
         headings = self._extract_headings(main_content)
@@ -62,7 +122,7 @@ class ContentCleaner:
         text = self._extract_clean_text(main_content)
 
         # Extract metadata hints
-        metadata = self._extract_metadata(soup)
+        metadata = self._extract_metadata(tree)
 
         return {
             'content_text': text,
@@ -71,72 +131,81 @@ class ContentCleaner:
             'word_count': len(text.split())
         }
 
-    def _remove_boilerplate(self, soup: BeautifulSoup):
-        """Remove common boilerplate elements from soup."""
-        # Remove by CSS selectors
-        for selector in self.BOILERPLATE_SELECTORS:
-            for element in soup.select(selector):
-                element.decompose()
+    def _remove_boilerplate(self, tree):
+        """Remove common boilerplate elements from the tree."""
+        # Remove by CSS selectors (one combined selector, one traversal)
+        for element in self._BOILERPLATE_SELECTOR(tree):
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
 
         # Remove script and style tags
-        for tag in soup(['script', 'style', 'noscript', 'iframe', 'svg']):
-            tag.decompose()
+        for element in list(tree.iter('script', 'style', 'noscript', 'iframe', 'svg')):
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
 
-        # Remove hidden elements
-        for element in soup.find_all(style=re.compile(r'display:\s*none')):
-            element.decompose()
+        # Remove comments (iterated natively by lxml, no text-node scan)
+        for comment in list(tree.iter(etree.Comment)):
+            parent = comment.getparent()
+            if parent is not None:
+                parent.remove(comment)
 
-        # Remove comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, NavigableString) and text.strip().startswith('<!--')):
-            comment.extract()
+        # Remove hidden elements
+        for element in tree.xpath('.//*[@style]'):
+            if self._DISPLAY_NONE_RE.search(element.get('style', '')):
+                parent = element.getparent()
+                if parent is not None:
+                    parent.remove(element)
 
-    def _extract_main_content(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _extract_main_content(self, tree):
         """
         Extract the main content area using heuristics.
         Returns the most likely content container.
         """
         # Try explicit content selectors first
-        for selector in self.CONTENT_SELECTORS:
-            content = soup.select_one(selector)
-            if content:
-                return content
+        for selector in self._CONTENT_SELECTOR_LIST:
+            matches = selector(tree)
+            if matches:
+                return matches[0]
 
         # Fallback: find the element with the most text
-        return self._find_largest_text_block(soup)
+        return self._find_largest_text_block(tree)
 
-    def _find_largest_text_block(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _find_largest_text_block(self, tree):
         """Find the element with the most text content."""
-        candidates = soup.find_all(['div', 'section', 'article'])
+        body = tree.find('body')
+        fallback = body if body is not None else tree
 
+        candidates = tree.xpath('.//div | .//section | .//article')
         if not candidates:
-            return soup.body if soup.body else soup
+            return fallback
 
         # Score each candidate by text length
-        best_candidate = soup.body if soup.body else soup
+        best_candidate = fallback
         max_text_length = 0
 
         for candidate in candidates:
-            # Get text but ignore nested candidates we've already counted
-            text_length = len(candidate.get_text(strip=True))
+            text_length = len(''.join(candidate.itertext()))
             if text_length > max_text_length:
                 max_text_length = text_length
                 best_candidate = candidate
 
         return best_candidate
 
-    def _extract_headings(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_headings(self, content) -> List[Dict[str, str]]:
         """Extract heading hierarchy from the content."""
         headings = []
-        for tag in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            text = tag.get_text(strip=True)
+        for tag in content.xpath('.//h1 | .//h2 | .//h3 | .//h4 | .//h5 | .//h6'):
+            text = self._element_text(tag)
             if text and not self._is_boilerplate_text(text):
                 headings.append({
-                    'level': tag.name,
+                    'level': tag.tag,
                     'text': text
                 })
         return headings
 
-    def _extract_clean_text(self, soup: BeautifulSoup) -> str:
+    def _extract_clean_text(self, content) -> str:
         """
         Extract clean, readable text from content.
         Preserves paragraph structure with double newlines.
@@ -144,33 +213,38 @@ class ContentCleaner:
         # Get text from paragraphs and list items
         text_blocks = []
 
-        for tag in soup.find_all(['p', 'li', 'td', 'th', 'blockquote']):
-            text = tag.get_text(strip=True)
+        for tag in content.xpath('.//p | .//li | .//td | .//th | .//blockquote'):
+            text = self._element_text(tag)
             if text and not self._is_boilerplate_text(text):
                 text_blocks.append(text)
 
-        # If no structured text found, fall back to all text
+        # If no structured text found, fall back to all text with a
+        # space separator between nodes
         if not text_blocks:
-            text = soup.get_text(separator=' ', strip=True)
-            # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text)
-            return text
+            return ' '.join(' '.join(content.itertext()).split())
 
         # Join with double newlines to preserve structure
         return '\n\n'.join(text_blocks)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _matches_boilerplate_pattern(text: str) -> bool:
+        """Check text against the boilerplate regex patterns.
+
+        Cached because the same nav/footer strings recur on nearly every
+        page, so repeats skip the regex evaluation entirely.
+        """
+        return bool(ContentCleaner._BOILERPLATE_RE.search(text))
+
     def _is_boilerplate_text(self, text: str) -> bool:
         """Check if text matches boilerplate patterns."""
-        text_lower = text.lower()
-
         # Check length
         if len(text) < 3 or len(text) > 500:  # Very short or suspiciously long single strings
             return False
 
         # Check patterns
-        for pattern in self.BOILERPLATE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
+        if self._matches_boilerplate_pattern(text):
+            return True
 
         # Check against known boilerplate fragments
         if text in self.boilerplate_fragments:
@@ -178,36 +252,40 @@ class ContentCleaner:
 
         return False
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict:
+    def _extract_metadata(self, tree) -> Dict:
         """Extract metadata hints from the page."""
         metadata = {}
 
         # Try to find department/category
-        for tag in soup.find_all(class_=re.compile(r'(department|category|section)')):
-            text = tag.get_text(strip=True)
-            if text:
-                metadata['department'] = text
-                break
+        for tag in tree.xpath('.//*[@class]'):
+            if self._DEPARTMENT_RE.search(tag.get('class', '')):
+                text = self._element_text(tag)
+                if text:
+                    metadata['department'] = text
+                    break
 
         # Try to find dates
-        for tag in soup.find_all(['time', 'span', 'div'], class_=re.compile(r'(date|published|updated)')):
+        for tag in tree.xpath('.//time[@class] | .//span[@class] | .//div[@class]'):
+            if not self._DATE_CLASS_RE.search(tag.get('class', '')):
+                continue
             datetime_attr = tag.get('datetime')
             if datetime_attr:
                 metadata['date'] = datetime_attr
                 break
-            text = tag.get_text(strip=True)
+            text = self._element_text(tag)
             # Simple date pattern matching
-            date_match = re.search(r'\b(\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b', text)
+            date_match = self._DATE_VALUE_RE.search(text)
             if date_match:
                 metadata['date'] = date_match.group(1)
                 break
 
         # Try to find document type
-        for tag in soup.find_all(class_=re.compile(r'(document-type|doc-type|type)')):
-            text = tag.get_text(strip=True)
-            if text:
-                metadata['document_type'] = text
-                break
+        for tag in tree.xpath('.//*[@class]'):
+            if self._DOC_TYPE_RE.search(tag.get('class', '')):
+                text = self._element_text(tag)
+                if text:
+                    metadata['document_type'] = text
+                    break
 
         return metadata
 
@@ -216,22 +294,24 @@ class ContentCleaner:
         Identify text that appears on many pages (likely boilerplate).
         Call this after scraping all pages to identify repeated content.
         """
-        # Count text fragments across pages
-        fragment_counts = {}
+        # Count text fragments across pages; Counter.update over a
+        # generator runs the accumulation at C level
+        fragment_counts = Counter()
 
         for page in pages:
-            soup = BeautifulSoup(page.get('html', ''), 'lxml')
-            # Get all text nodes
-            for text in soup.find_all(string=True):
-                cleaned = text.strip()
-                if 10 < len(cleaned) < 200:  # Reasonable fragment size
-                    fragment_counts[cleaned] = fragment_counts.get(cleaned, 0) + 1
+            tree = self._parse_html(_page_html(page))
+            if tree is None:
+                continue
+            fragment_counts.update(
+                cleaned for cleaned in (text.strip() for text in tree.itertext())
+                if 10 < len(cleaned) < 200  # Reasonable fragment size
+            )
 
         # Mark fragments that appear on >50% of pages as boilerplate
         threshold = len(pages) * 0.5
-        for fragment, count in fragment_counts.items():
-            if count > threshold:
-                self.boilerplate_fragments.add(fragment)
+        self.boilerplate_fragments = {
+            fragment for fragment, count in fragment_counts.items() if count > threshold
+        }
 
         print(f"Identified {len(self.boilerplate_fragments)} common boilerplate fragments")
 
@@ -239,26 +319,48 @@ class ContentCleaner:
         """
         Clean all pages in the crawl results.
         First identifies common boilerplate, then cleans each page.
+
+        The per-page cleaning is pure CPU-bound HTML parsing, so it is
+        fanned out across cores with a process pool.
         """
         print("Analyzing pages for common boilerplate...")
         self.identify_common_boilerplate(pages)
 
-        print("Cleaning page content...")
-        cleaned_pages = []
-
-        for i, page in enumerate(pages):
-            print(f"  Cleaning {i+1}/{len(pages)}: {page['url']}")
-            cleaned_data = self.clean_page(page.get('html', ''), page['url'])
-
-            # Merge with original page data (excluding HTML)
-            cleaned_page = {
-                'url': page['url'],
-                'title': page['title'],
-                'scraped_at': page['scraped_at'],
-                'depth': page['depth'],
-                'links': page['links'],
-                **cleaned_data
-            }
-            cleaned_pages.append(cleaned_page)
+        print(f"Cleaning {len(pages)} pages across cores...")
+        with ProcessPoolExecutor(
+            initializer=_init_clean_worker,
+            initargs=(self.boilerplate_fragments,)
+        ) as executor:
+            cleaned_pages = list(executor.map(_clean_page_worker, pages, chunksize=16))
 
         return cleaned_pages
+
+
+# Per-process cleaner used by the process pool in clean_all_pages.
+# Workers get the shared boilerplate fragments via the pool initializer
+# so the set is pickled once per process instead of once per page.
+_worker_cleaner: ContentCleaner = None
+
+
+def _init_clean_worker(boilerplate_fragments: Set[str]):
+    """Initialize one pool worker with a cleaner sharing the fragment set."""
+    global _worker_cleaner
+    _worker_cleaner = ContentCleaner()
+    _worker_cleaner.boilerplate_fragments = boilerplate_fragments
+
+
+def _clean_page_worker(page: Dict) -> Dict:
+    """Clean one page in a pool worker and merge with its crawl metadata."""
+    cleaned_data = _worker_cleaner.clean_page(_page_html(page), page['url'])
+
+    # Merge with original page data (excluding HTML); the PDF flag is
+    # precomputed here so downstream stats never rescan the links
+    return {
+        'url': page['url'],
+        'title': page['title'],
+        'scraped_at': page['scraped_at'],
+        'depth': page['depth'],
+        'links': page['links'],
+        'has_pdfs': any(link['type'] == 'pdf' for link in page['links']),
+        **cleaned_data
+    }
@@ -1,42 +1,14 @@
 #!/usr/bin/env python3
 """Generate document_catalog.md from analysis data"""
-import json
+import functools
+import io
 import argparse
 from pathlib import Path
 from collections import defaultdict
 
-# Parse arguments
-parser = argparse.ArgumentParser(description='Generate document catalog from analysis')
-parser.add_argument('--site-id', type=str, default='', help='Site identifier for multi-site catalogs (e.g., "village", "district97")')
-args = parser.parse_args()
-
-# Determine filename prefix
-prefix = f"{args.site_id}_" if args.site_id else ""
-
-# Load analysis
-with open('output/analysis.json', 'r') as f:
-    analysis = json.load(f)
-
-pdf_categories = analysis['pdf_categories']
-
-# Start building the markdown
-output = ["# Oak Park Website - Document Catalog\n\n"]
-output.append("A comprehensive catalog of PDF documents available on the Village of Oak Park website.\n\n")
-output.append(f"**Total Documents**: {sum(len(pdfs) for pdfs in pdf_categories.values())}\n")
-output.append(f"**Total Size**: {analysis['statistics']['total_pdfs']} documents cataloged\n\n")
-output.append("---\n\n")
-
-# Summary by category
-output.append("## Document Categories Summary\n\n")
-output.append("| Category | Count |\n")
-output.append("|----------|-------|\n")
-for category, pdfs in sorted(pdf_categories.items(), key=lambda x: len(x[1]), reverse=True):
-    cat_name = category.replace('_', ' ').title()
-    output.append(f"| {cat_name} | {len(pdfs)} |\n")
-output.append("\n---\n\n")
-
-# Detailed sections
-category_descriptions = {
+import orjson
+
+CATEGORY_DESCRIPTIONS = {
     'financial': "Budget documents, financial reports, audits, and fiscal transparency documents.",
     'meeting_minutes': "Meeting minutes, agendas, and proceedings from Village Board and commissions.",
     'policies': "Official village policies, protocols, procedures, and guidelines.",
@@ -48,81 +20,136 @@ category_descriptions = {
     'other': "Miscellaneous documents that don't fit into specific categories."
 }
 
-for category, pdfs in sorted(pdf_categories.items(), key=lambda x: len(x[1]), reverse=True):
-    cat_name = category.replace('_', ' ').title()
-    output.append(f"## {cat_name}\n\n")
 
-    if category in category_descriptions:
-        output.append(f"*{category_descriptions[category]}*\n\n")
+@functools.lru_cache(maxsize=4096)
+def prettify_parent(url):
+    """Turn a parent page URL into a readable breadcrumb-style name.
+
+    Memoized: the same parent URLs come up once per category plus once in
+    the overall ranking, so repeats are a cache hit.
+    """
+    name = url.replace('https://www.oak-park.us/', '').replace('https://oak-park.us/', '')
+    return name.replace('/', ' › ').replace('-', ' ').title()
+
+
+def build_document_catalog(analysis: dict, site_id: str = '') -> Path:
+    """Build document_catalog.md from an in-memory analysis dict.
+
+    Callable directly from the analyzer so pipeline runs skip re-parsing
+    analysis.json; returns the path of the written catalog.
+    """
+    # Determine filename prefix
+    prefix = f"{site_id}_" if site_id else ""
+
+    pdf_categories = analysis['pdf_categories']
+
+    # Start building the markdown
+    buf = io.StringIO()
+    buf.write("# Oak Park Website - Document Catalog\n\n")
+    buf.write("A comprehensive catalog of PDF documents available on the Village of Oak Park website.\n\n")
+    buf.write(f"**Total Documents**: {sum(len(pdfs) for pdfs in pdf_categories.values())}\n")
+    buf.write(f"**Total Size**: {analysis['statistics']['total_pdfs']} documents cataloged\n\n")
+    buf.write("---\n\n")
+
+    # Summary by category
+    buf.write("## Document Categories Summary\n\n")
+    buf.write("| Category | Count |\n")
+    buf.write("|----------|-------|\n")
+    for category, pdfs in sorted(pdf_categories.items(), key=lambda x: len(x[1]), reverse=True):
+        cat_name = category.replace('_', ' ').title()
+        buf.write(f"| {cat_name} | {len(pdfs)} |\n")
+    buf.write("\n---\n\n")
+
+    # Detailed sections
+    for category, pdfs in sorted(pdf_categories.items(), key=lambda x: len(x[1]), reverse=True):
+        cat_name = category.replace('_', ' ').title()
+        buf.write(f"## {cat_name}\n\n")
+
+        if category in CATEGORY_DESCRIPTIONS:
+            buf.write(f"*{CATEGORY_DESCRIPTIONS[category]}*\n\n")
+
+        buf.write(f"**Total Documents**: {len(pdfs)}\n\n")
+
+        # Group by parent page for better organization
+        by_parent = defaultdict(list)
+        for pdf in pdfs:
+            parent = pdf.get('parent_page', 'Unknown')
+            by_parent[parent].append(pdf)
+
+        # Show documents grouped by parent page (top 10 parent pages)
+        sorted_parents = sorted(by_parent.items(), key=lambda x: len(x[1]), reverse=True)
+
+        for parent_url, parent_pdfs in sorted_parents[:10]:
+            # Clean up parent page name
+            parent_name = prettify_parent(parent_url)
+
+            buf.write(f"### {parent_name}\n")
+            buf.write(f"*Source: {parent_url}*\n\n")
+
+            # List PDFs from this parent (limit to 10)
+            for pdf in parent_pdfs[:10]:
+                title = pdf['title'].strip()
+                if title == "Untitled PDF" or not title:
+                    title = pdf['url'].split('/')[-1]
 
-    output.append(f"**Total Documents**: {len(pdfs)}\n\n")
+                size_str = f"{pdf['file_size_mb']} MB" if pdf['file_size_mb'] > 0 else "Unknown size"
 
-    # Group by parent page for better organization
-    by_parent = defaultdict(list)
-    for pdf in pdfs:
-        parent = pdf.get('parent_page', 'Unknown')
-        by_parent[parent].append(pdf)
+                buf.write(f"- **{title}**\n")
+                buf.write(f"  - URL: {pdf['url']}\n")
+                buf.write(f"  - Size: {size_str}\n")
 
-    # Show documents grouped by parent page (top 10 parent pages)
-    sorted_parents = sorted(by_parent.items(), key=lambda x: len(x[1]), reverse=True)
+                if pdf.get('last_modified'):
+                    buf.write(f"  - Last Modified: {pdf['last_modified']}\n")
+                buf.write("\n")
 
-    for parent_url, parent_pdfs in sorted_parents[:10]:
-        # Clean up parent page name
-        parent_name = parent_url.replace('https://www.oak-park.us/', '').replace('https://oak-park.us/', '')
-        parent_name = parent_name.replace('/', ' › ').replace('-', ' ').title()
+            if len(parent_pdfs) > 10:
+                buf.write(f"  *...and {len(parent_pdfs) - 10} more documents*\n\n")
 
-        output.append(f"### {parent_name}\n")
-        output.append(f"*Source: {parent_url}*\n\n")
+        if len(sorted_parents) > 10:
+            remaining_docs = sum(len(pdfs) for _, pdfs in sorted_parents[10:])
+            buf.write(f"\n*...and {remaining_docs} more documents from other pages*\n\n")
 
-        # List PDFs from this parent (limit to 10)
-        for pdf in parent_pdfs[:10]:
-            title = pdf['title'].strip()
-            if title == "Untitled PDF" or not title:
-                title = pdf['url'].split('/')[-1]
+        buf.write("---\n\n")
 
-            size_str = f"{pdf['file_size_mb']} MB" if pdf['file_size_mb'] > 0 else "Unknown size"
+    # Key document finder section
+    buf.write("## Finding Specific Documents\n\n")
+    buf.write("### Most Common Document Locations\n\n")
 
-            output.append(f"- **{title}**\n")
-            output.append(f"  - URL: {pdf['url']}\n")
-            output.append(f"  - Size: {size_str}\n")
+    # Identify pages with most documents
+    all_pdfs = [pdf for pdfs in pdf_categories.values() for pdf in pdfs]
+    by_parent_all = defaultdict(list)
+    for pdf in all_pdfs:
+        by_parent_all[pdf.get('parent_page', 'Unknown')].append(pdf)
 
-            if pdf.get('last_modified'):
-                output.append(f"  - Last Modified: {pdf['last_modified']}\n")
-            output.append("\n")
+    sorted_all_parents = sorted(by_parent_all.items(), key=lambda x: len(x[1]), reverse=True)
 
-        if len(parent_pdfs) > 10:
-            output.append(f"  *...and {len(parent_pdfs) - 10} more documents*\n\n")
+    buf.write("These pages contain the most documents:\n\n")
+    for parent_url, parent_pdfs in sorted_all_parents[:10]:
+        parent_name = prettify_parent(parent_url)
+        buf.write(f"- **{parent_name}**: {len(parent_pdfs)} documents\n")
+        buf.write(f"  - {parent_url}\n\n")
 
-    if len(sorted_parents) > 10:
-        remaining_docs = sum(len(pdfs) for _, pdfs in sorted_parents[10:])
-        output.append(f"\n*...and {remaining_docs} more documents from other pages*\n\n")
+    # Write the output
+    # Ensure analysis directory exists
+    Path('output/analysis').mkdir(parents=True, exist_ok=True)
+    output_path = Path(f'output/analysis/{prefix}document_catalog.md')
+    output_path.write_text(buf.getvalue())
 
-    output.append("---\n\n")
+    print(f"✓ Generated {output_path}")
 
-# Key document finder section
-output.append("## Finding Specific Documents\n\n")
-output.append("### Most Common Document Locations\n\n")
+    return output_path
 
-# Identify pages with most documents
-all_pdfs = [pdf for pdfs in pdf_categories.values() for pdf in pdfs]
-by_parent_all = defaultdict(list)
-for pdf in all_pdfs:
-    by_parent_all[pdf.get('parent_page', 'Unknown')].append(pdf)
 
-sorted_all_parents = sorted(by_parent_all.items(), key=lambda x: len(x[1]), reverse=True)
+def main():
+    # Parse arguments
+    parser = argparse.ArgumentParser(description='Generate document catalog from analysis')
+    parser.add_argument('--site-id', type=str, default='', help='Site identifier for multi-site catalogs (e.g., "village", "district97")')
+    args = parser.parse_args()
 
-output.append("These pages contain the most documents:\n\n")
-for parent_url, parent_pdfs in sorted_all_parents[:10]:
-    parent_name = parent_url.replace('https://www.oak-park.us/', '').replace('https://oak-park.us/', '')
-    parent_name = parent_name.replace('/', ' › ').replace('-', ' ').title()
-    output.append(f"- **{parent_name}**: {len(parent_pdfs)} documents\n")
-    output.append(f"  - {parent_url}\n\n")
+    # Load analysis
+    analysis = orjson.loads(Path('output/analysis.json').read_bytes())
+    build_document_catalog(analysis, site_id=args.site_id)
 
-# Write the output
-# Ensure analysis directory exists
-Path('output/analysis').mkdir(parents=True, exist_ok=True)
-output_path = Path(f'output/analysis/{prefix}document_catalog.md')
-with open(output_path, 'w') as f:
-    f.writelines(output)
 
-print(f"✓ Generated {output_path}")
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Generate page_index.md from analysis data"""
-import json
 import argparse
+import heapq
+import io
 from pathlib import Path
 
+import orjson
+
 # Parse arguments
 parser = argparse.ArgumentParser(description='Generate page index from catalog analysis')
 parser.add_argument('--site-id', type=str, default='', help='Site identifier for multi-site catalogs (e.g., "village", "district97")')
@@ -13,25 +16,26 @@ args = parser.parse_args()
 prefix = f"{args.site_id}_" if args.site_id else ""
 
 # Load analysis
-with open('output/analysis.json', 'r') as f:
-    analysis = json.load(f)
+analysis = orjson.loads(Path('output/analysis.json').read_bytes())
 
 sections = analysis['sections']
 key_pages = analysis['key_pages']
 
-# Start building the markdown
-output = ["# Oak Park Website - Page Index\n"]
-output.append("An organized index of important pages on the Village of Oak Park website.\n")
-output.append(f"**Total Pages**: {len([p for pages in sections.values() for p in pages])}\n")
-output.append("---\n\n")
+# Build the markdown in one in-memory buffer; a list of hundreds of
+# small strings costs a write() call per element at the end
+buf = io.StringIO()
+buf.write("# Oak Park Website - Page Index\n")
+buf.write("An organized index of important pages on the Village of Oak Park website.\n")
+buf.write(f"**Total Pages**: {sum(len(pages) for pages in sections.values())}\n")
+buf.write("---\n\n")
 
 # Table of Contents
-output.append("## Table of Contents\n")
+buf.write("## Table of Contents\n")
 for i, section in enumerate(sections.keys(), 1):
     if section not in ['Home?Oc_Lang=Tl', 'Home?Oc_Lang=En Us']:  # Skip language variants
         anchor = section.lower().replace(' ', '-').replace('?', '').replace('=', '')
-        output.append(f"{i}. [{section}](#{anchor})\n")
-output.append("\n---\n\n")
+        buf.write(f"{i}. [{section}](#{anchor})\n")
+buf.write("\n---\n\n")
 
 # Main Sections
 for section_name, pages in sections.items():
@@ -39,14 +43,13 @@ for section_name, pages in sections.items():
     if section_name in ['Home?Oc_Lang=Tl', 'Home?Oc_Lang=En Us']:
         continue
 
-    output.append(f"## {section_name}\n\n")
-    output.append(f"*{len(pages)} pages in this section*\n\n")
-
-    # Sort pages by word count (most substantial first)
-    sorted_pages = sorted(pages, key=lambda p: p['word_count'], reverse=True)
+    buf.write(f"## {section_name}\n\n")
+    buf.write(f"*{len(pages)} pages in this section*\n\n")
 
-    # Take top 15 pages per section or all if fewer
-    top_pages = sorted_pages[:15]
+    # Take the top 15 pages by word count (most substantial first);
+    # nlargest avoids sorting the whole section
+    top_pages = heapq.nlargest(15, pages, key=lambda p: p['word_count'])
+    extra = max(0, len(pages) - 15)
 
     for page in top_pages:
         # Clean up the title
@@ -64,30 +67,29 @@ for section_name, pages in sections.items():
         else:
             length = "Brief"
 
-        output.append(f"### {title}{pdf_marker}\n")
-        output.append(f"**URL**: {page['url']}\n\n")
-        output.append(f"**Content**: {length} ({page['word_count']} words)\n\n")
+        buf.write(f"### {title}{pdf_marker}\n")
+        buf.write(f"**URL**: {page['url']}\n\n")
+        buf.write(f"**Content**: {length} ({page['word_count']} words)\n\n")
 
         # Add key headings if available
         if page['headings']:
             main_headings = [h for h in page['headings'] if h['level'] in ['h1', 'h2']]
             if main_headings:
-                output.append("**Topics Covered**:\n")
+                buf.write("**Topics Covered**:\n")
                 for heading in main_headings[:5]:
-                    output.append(f"- {heading['text']}\n")
-                output.append("\n")
+                    buf.write(f"- {heading['text']}\n")
+                buf.write("\n")
 
-        output.append("---\n\n")
+        buf.write("---\n\n")
 
     # If there are more pages, note it
-    if len(sorted_pages) > 15:
-        output.append(f"*...and {len(sorted_pages) - 15} more pages in this section*\n\n")
+    if extra:
+        buf.write(f"*...and {extra} more pages in this section*\n\n")
 
-# Write the output
+# Write the output in a single call
 # Ensure analysis directory exists
 Path('output/analysis').mkdir(parents=True, exist_ok=True)
 output_path = Path(f'output/analysis/{prefix}page_index.md')
-with open(output_path, 'w') as f:
-    f.writelines(output)
+output_path.write_text(buf.getvalue(), encoding='utf-8')
 
 print(f"✓ Generated {output_path}")
@@ -47,6 +47,13 @@ Examples:
         help='Delay in seconds between requests (default: 1.0)'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Number of concurrent page fetches (default: 8)'
+    )
+
     parser.add_argument(
         '--output',
         default='output',
@@ -90,7 +97,8 @@ Examples:
         delay=args.delay,
         user_agent=args.user_agent,
         skip_languages=not args.no_skip_languages,
-        output_dir=args.output  # Enable incremental writing
+        output_dir=args.output,  # Enable incremental writing
+        concurrency=args.concurrency
     )
     scraper.start()
 
@@ -1,14 +1,60 @@
 """
 Web scraper for municipal websites with robots.txt compliance and rate limiting.
 """
+import asyncio
+import functools
+import gzip
+import json
+import os
 import re
-import time
 import urllib.parse
 import urllib.robotparser
-from typing import Set, Dict, Optional, List
+from typing import Set, Dict, NamedTuple, Optional, List, Tuple
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import pybloom_live
+import xxhash
+from lxml import etree
+from lxml import html as lhtml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson's fast path."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(data: bytes):
+    """Deserialize JSON bytes, preferring orjson's fast path."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _LinkInfo(NamedTuple):
+    """Classification of one href: normalized absolute URL plus link type."""
+    url: str
+    type: str
+
+
+def _write_bytes(path, payload: bytes):
+    """Write a small file with raw os calls.
+
+    open(path, 'w') builds a TextIOWrapper/BufferedWriter stack and costs
+    several extra syscalls per file; for thousands of small page files the
+    three-syscall open/write/close path is noticeably cheaper.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
 
 
 class MunicipalScraper:
@@ -19,8 +65,22 @@ class MunicipalScraper:
         'sv', 'da', 'fi', 'no', 'hu', 'el', 'he', 'bn', 'fa', 'ur'
     ]
 
+    # Language detection compiles once at class load: one alternation over
+    # all codes instead of a per-URL loop over the list. The path pattern
+    # matches /es/ or /es- segments anywhere in the path; the query pattern
+    # matches lang=es, oc_lang=es, language=es, etc.
+    _LANG_ALTERNATION = '|'.join(DEFAULT_SKIP_LANGUAGES)
+    _LANG_PATH_RE = re.compile(rf'/(?:{_LANG_ALTERNATION})(?:/|-)')
+    _LANG_QUERY_RE = re.compile(rf'lang(?:uage)?=(?:{_LANG_ALTERNATION})\b')
+
+    # PDF cataloging runs on its own worker tasks so HEAD requests never
+    # stall page crawling; catalog writes are debounced to this interval
+    _PDF_WORKERS = 4
+    _PDF_FLUSH_INTERVAL = 5.0
+
     def __init__(self, base_url: str, max_depth: int = 3, delay: float = 1.0,
-                 user_agent: str = None, skip_languages: bool = True, output_dir: str = None):
+                 user_agent: str = None, skip_languages: bool = True, output_dir: str = None,
+                 concurrency: int = 8):
         """
         Initialize the scraper.
 
@@ -31,6 +91,8 @@ class MunicipalScraper:
             user_agent: Custom user agent string
             skip_languages: Whether to skip non-English language versions (default: True)
             output_dir: Directory for incremental output (enables crash recovery)
+            concurrency: Number of pages fetched concurrently; the aggregate
+                request rate still honors `delay`
         """
         self.base_url = base_url.rstrip('/')
         self.domain = urllib.parse.urlparse(base_url).netloc
@@ -39,29 +101,64 @@ class MunicipalScraper:
         self.user_agent = user_agent or "MunicipalScraper/1.0 (Educational/Archival)"
         self.skip_languages = skip_languages
         self.output_dir = output_dir
+        self.concurrency = concurrency
 
         self.visited_urls: Set[str] = set()
+
+        # Enqueue-time dedup: the Bloom filter gives a fast probabilistic
+        # "seen before" answer, the set confirms positives so false hits
+        # never drop a URL
+        self._seen: Set[str] = set()
+        self._bloom = pybloom_live.ScalableBloomFilter(
+            initial_capacity=100_000, error_rate=1e-4
+        )
+
         self.pages: List[Dict] = []
         self.pdfs: List[Dict] = []
+        self._pdf_urls: Set[str] = set()
         self.site_graph: Dict[str, List[str]] = {}
         self.skipped_language_count: int = 0
         self.total_links_found: int = 0
 
+        # Async crawl state, set up in _crawl
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._pdf_queue: Optional[asyncio.Queue] = None
+        self._throttle_lock: Optional[asyncio.Lock] = None
+        self._next_fetch_time: float = 0.0
+        self._pdfs_dirty: bool = False
+        self._pdf_flush_task: Optional[asyncio.Task] = None
+
+        # Append-only log of visited URLs; None when incremental writing
+        # is disabled
+        self._state_log = None
+        self._visits_logged: int = 0
+
         # Setup incremental writing if output_dir provided
         if self.output_dir:
             from pathlib import Path
-            import json
             self.output_path = Path(self.output_dir)
             self.pages_dir = self.output_path / 'pages'
             self.pdfs_dir = self.output_path / 'pdfs'
             self.state_file = self.output_path / '.crawl_state.json'
+            self.state_log_file = self.output_path / '.crawl_state.ndjson'
 
             # Create directories
             self.pages_dir.mkdir(parents=True, exist_ok=True)
             self.pdfs_dir.mkdir(parents=True, exist_ok=True)
 
-            # Load previous state if resuming
+            # Load previous state if resuming, then open the log for
+            # appending new visits
             self._load_state()
+            self._state_log = open(self.state_log_file, 'ab')
+
+        # Per-instance memoization of robots.txt decisions; they depend
+        # only on (scheme, netloc, path), never on the query string
+        self._can_fetch_cached = functools.lru_cache(maxsize=8192)(self._can_fetch_uncached)
+
+        # Link classification memoized on the raw href: nav hrefs repeat
+        # on nearly every page, and each classification costs a urlparse
+        self._classify_link = functools.lru_cache(maxsize=65536)(self._classify_link_uncached)
 
         # Setup robots.txt parser
         self.robot_parser = urllib.robotparser.RobotFileParser()
@@ -74,55 +171,113 @@ class MunicipalScraper:
 
     def _load_state(self):
         """Load previous crawl state for resuming."""
-        import json
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    self.visited_urls = set(state.get('visited_urls', []))
-                    self.skipped_language_count = state.get('skipped_language_count', 0)
-                    self.total_links_found = state.get('total_links_found', 0)
-                    print(f"Resuming: Found {len(self.visited_urls)} previously crawled URLs")
+                state = _load_json(self.state_file.read_bytes())
+                # Older state files carried the full visited list; still
+                # honor it on resume
+                self.visited_urls.update(state.get('visited_urls', []))
+                self.skipped_language_count = state.get('skipped_language_count', 0)
+                self.total_links_found = state.get('total_links_found', 0)
             except Exception as e:
                 print(f"Warning: Could not load previous state: {e}")
 
+        if self.state_log_file.exists():
+            try:
+                with open(self.state_log_file, 'rb') as log:
+                    for line in log:
+                        if line.strip():
+                            self.visited_urls.add(_load_json(line)['u'])
+            except Exception as e:
+                print(f"Warning: Could not load visited-URL log: {e}")
+
+        if self.visited_urls:
+            # Seed the dedup structures so resumed crawls don't
+            # re-enqueue already-visited URLs
+            self._seen.update(self.visited_urls)
+            for visited in self.visited_urls:
+                self._bloom.add(visited)
+            print(f"Resuming: Found {len(self.visited_urls)} previously crawled URLs")
+
     def _save_state(self):
-        """Save current crawl state."""
-        import json
+        """Save aggregate crawl counters.
+
+        Visited URLs live in the append-only NDJSON log; rewriting them
+        here every 10 pages made the cumulative state I/O quadratic in
+        crawl size.
+        """
         if self.output_dir:
             try:
                 state = {
-                    'visited_urls': list(self.visited_urls),
                     'skipped_language_count': self.skipped_language_count,
                     'total_links_found': self.total_links_found,
                     'base_url': self.base_url,
+                    'pages_crawled': len(self.pages),
                     'last_updated': datetime.utcnow().isoformat()
                 }
-                with open(self.state_file, 'w') as f:
-                    json.dump(state, f, indent=2)
+                _write_bytes(self.state_file, _dump_json(state))
             except Exception as e:
                 print(f"Warning: Could not save state: {e}")
+            if self._state_log is not None:
+                self._state_log.flush()
+
+    def _log_visit(self, url: str, depth: int):
+        """Append one visited URL to the NDJSON state log."""
+        if self._state_log is None:
+            return
+        try:
+            record = {'u': url, 'd': depth}
+            payload = orjson.dumps(record) if orjson is not None else json.dumps(record).encode('utf-8')
+            self._state_log.write(payload + b'\n')
+            self._visits_logged += 1
+            if self._visits_logged % 10 == 0:
+                self._state_log.flush()
+        except Exception as e:
+            print(f"Warning: Could not log visit for {url}: {e}")
 
     def _url_to_hash(self, url: str) -> str:
-        """Convert URL to a consistent filename hash."""
-        import hashlib
-        return hashlib.md5(url.encode()).hexdigest()
+        """Convert URL to a consistent filename hash.
+
+        Filename mapping is not security-relevant, so xxh3 beats the
+        cryptographic hashes by roughly an order of magnitude. Must stay
+        in sync with OutputWriter._url_to_hash so cleaned page files
+        overwrite their incremental counterparts.
+        """
+        return xxhash.xxh3_64_hexdigest(url.encode())
 
     def _write_page_incremental(self, page_data: Dict):
         """Write a single page immediately to disk."""
-        import json
-        if self.output_dir:
-            try:
-                url_hash = self._url_to_hash(page_data['url'])
-                file_path = self.pages_dir / f"{url_hash}.json"
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(page_data, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                print(f"Warning: Could not write page {page_data['url']}: {e}")
+        if not self.output_dir:
+            return
+        try:
+            url_hash = self._url_to_hash(page_data['url'])
+            file_path = self.pages_dir / f"{url_hash}.json"
+            _write_bytes(file_path, _dump_json(page_data))
+        except Exception as e:
+            print(f"Warning: Could not write page {page_data['url']}: {e}")
+
+    def _write_html_incremental(self, url_hash: str, content: bytes):
+        """Write raw HTML bytes as a gzip sidecar next to the page JSON.
+
+        Storing HTML inside the page JSON forced escaping of every quote
+        and backslash and inflated the file 10-30%; the sidecar keeps the
+        fetched bytes as-is and compresses them 5-10x. Level 1 trades a
+        few percent of ratio for ~3x faster compression.
+
+        Returns the sidecar path, or None if the write failed.
+        """
+        if not self.output_dir:
+            return None
+        try:
+            html_path = self.pages_dir / f"{url_hash}.html.gz"
+            _write_bytes(html_path, gzip.compress(content, compresslevel=1))
+            return html_path
+        except Exception as e:
+            print(f"Warning: Could not write HTML for page {url_hash}: {e}")
+            return None
 
     def _write_pdfs_incremental(self):
         """Write the current PDF catalog to disk."""
-        import json
         if self.output_dir:
             try:
                 catalog_path = self.pdfs_dir / 'catalog.json'
@@ -131,137 +286,148 @@ class MunicipalScraper:
                     'total_size_mb': sum(pdf['file_size_mb'] for pdf in self.pdfs),
                     'pdfs': self.pdfs
                 }
-                with open(catalog_path, 'w', encoding='utf-8') as f:
-                    json.dump(catalog, f, indent=2, ensure_ascii=False)
+                _write_bytes(catalog_path, _dump_json(catalog))
             except Exception as e:
                 print(f"Warning: Could not write PDF catalog: {e}")
 
     def can_fetch(self, url: str) -> bool:
         """Check if we're allowed to fetch this URL according to robots.txt."""
+        parsed = urllib.parse.urlparse(url)
+        return self._can_fetch_cached(parsed.scheme, parsed.netloc, parsed.path)
+
+    def _can_fetch_uncached(self, scheme: str, netloc: str, path: str) -> bool:
+        """Uncached robots.txt check; wrapped by lru_cache in __init__."""
+        url = urllib.parse.urlunparse((scheme, netloc, path, '', '', ''))
         try:
             return self.robot_parser.can_fetch(self.user_agent, url)
         except Exception:
             return True  # If check fails, proceed cautiously
 
+    def _should_enqueue(self, url: str) -> bool:
+        """Record a URL as seen and report whether it is new.
+
+        Checked before enqueueing so duplicate links (nav menus repeat on
+        every page) never enter the queue at all.
+        """
+        if url in self._bloom and url in self._seen:
+            return False
+        self._seen.add(url)
+        self._bloom.add(url)
+        return True
+
     def normalize_domain(self, domain: str) -> str:
         """Normalize domain by removing www prefix for comparison."""
         if domain.startswith('www.'):
             return domain[4:]
         return domain
 
-    def is_internal_url(self, url: str) -> bool:
-        """Check if URL is internal to the base domain."""
-        parsed = urllib.parse.urlparse(url)
-        if parsed.netloc == '':
-            return True  # Relative URL
-
-        # Normalize both domains for comparison (handles www subdomain)
-        url_domain = self.normalize_domain(parsed.netloc)
-        base_domain = self.normalize_domain(self.domain)
-
-        return url_domain == base_domain
-
-    def is_valid_http_url(self, url: str) -> bool:
-        """Check if URL uses HTTP or HTTPS scheme."""
-        parsed = urllib.parse.urlparse(url)
-        # If no scheme, it's a relative URL (valid)
-        # If scheme exists, it must be http or https
-        return parsed.scheme in ('', 'http', 'https')
-
     def is_language_url(self, url: str) -> bool:
         """Check if URL appears to be a non-English language version."""
         if not self.skip_languages:
             return False
 
         parsed = urllib.parse.urlparse(url)
-        path = parsed.path.lower()
-        query = parsed.query.lower()
-
-        # Check for language codes in path (e.g., /es/, /fr/, /es-es/)
-        for lang in self.DEFAULT_SKIP_LANGUAGES:
-            # Match /es/ or /es-XX/ patterns
-            if f'/{lang}/' in path or f'/{lang}-' in path:
-                return True
-            # Match paths starting with language code
-            if path.startswith(f'/{lang}/') or path.startswith(f'/{lang}-'):
-                return True
-
-        # Check for language in query parameters
-        # Matches: ?lang=es, &lang=es, ?oc_lang=es, ?language=es, etc.
-        for lang in self.DEFAULT_SKIP_LANGUAGES:
-            # Match any parameter containing 'lang' followed by =<langcode>
-            if f'lang={lang}' in query:
-                return True
-            # Also check for language code at start of query param value
-            if f'={lang}' in query:
-                # More specific check to avoid false positives
-                # Match patterns like lang=es, oc_lang=es, language=es
-                if re.search(rf'[_-]?lang(?:uage)?={lang}\b', query):
-                    return True
-
-        return False
-
-    def normalize_url(self, url: str) -> str:
-        """Normalize URL by removing fragments and making absolute."""
-        parsed = urllib.parse.urlparse(url)
-        # Remove fragment
-        normalized = urllib.parse.urlunparse(parsed._replace(fragment=''))
-        # Make absolute
-        if not normalized.startswith('http'):
-            normalized = urllib.parse.urljoin(self.base_url, normalized)
-        return normalized
+        return self._matches_language(parsed.path.lower(), parsed.query.lower())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _matches_language(path: str, query: str) -> bool:
+        """Check a lowercased (path, query) pair against the language regexes.
+
+        Cached because many links share the same path and query; repeats
+        skip the regex evaluation entirely.
+        """
+        # Path codes like /es/, /fr/, /es-es/; query params like ?lang=es,
+        # &oc_lang=es, ?language=es
+        return bool(
+            MunicipalScraper._LANG_PATH_RE.search(path)
+            or MunicipalScraper._LANG_QUERY_RE.search(query)
+        )
 
     def is_pdf(self, url: str) -> bool:
         """Check if URL points to a PDF."""
         return url.lower().endswith('.pdf')
 
-    def fetch_page(self, url: str) -> Optional[requests.Response]:
-        """Fetch a page with proper headers and error handling."""
-        headers = {
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        }
+    def _classify_link_uncached(self, href: str) -> Optional[_LinkInfo]:
+        """Classify one href with a single urlparse.
+
+        Scheme validation, fragment-stripping normalization, and the
+        internal-domain check used to live in separate methods that each
+        parsed the URL again; folding them into one pass keeps
+        extract_links to one parse per href. Returns None for non-HTTP
+        links (mailto:, tel:, javascript:, etc.). Wrapped by lru_cache
+        in __init__.
+        """
+        parsed = urllib.parse.urlparse(href)
+        if parsed.scheme not in ('', 'http', 'https'):
+            return None
+
+        # Normalize: strip the fragment and make absolute
+        normalized = urllib.parse.urlunparse(parsed._replace(fragment=''))
+        if not normalized.startswith('http'):
+            normalized = urllib.parse.urljoin(self.base_url, normalized)
+            parsed = urllib.parse.urlparse(normalized)
+
+        if self.normalize_domain(parsed.netloc) != self.normalize_domain(self.domain):
+            link_type = 'external'
+        elif self.is_pdf(normalized):
+            link_type = 'pdf'
+        else:
+            link_type = 'internal'
+
+        return _LinkInfo(normalized, link_type)
+
+    async def _throttle(self):
+        """Gate request starts so the aggregate rate honors self.delay.
+
+        A token-bucket over the event loop clock: each caller claims the
+        next fetch slot under the lock, then sleeps outside it until the
+        slot arrives. N workers stay in flight while the site still sees
+        at most one new request per delay interval.
+        """
+        async with self._throttle_lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_fetch_time - now
+            self._next_fetch_time = max(now, self._next_fetch_time) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def fetch_page(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Fetch a page through the shared session.
 
+        Returns (body, content_type) or None on error.
+        """
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            return response
-        except requests.RequestException as e:
+            async with self._session.get(url) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                return await response.read(), content_type
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"Error fetching {url}: {e}")
             return None
 
-    def extract_links(self, soup: BeautifulSoup, current_url: str) -> List[Dict[str, str]]:
+    def extract_links(self, tree, current_url: str) -> List[Dict[str, str]]:
         """Extract all links from a page with context."""
         links = []
-        for anchor in soup.find_all('a', href=True):
-            href = anchor['href']
-
-            # Skip non-HTTP(S) URLs (mailto:, tel:, javascript:, etc.)
-            if not self.is_valid_http_url(href):
+        for anchor in tree.iter('a'):
+            href = anchor.get('href')
+            if href is None:
                 continue
 
-            normalized = self.normalize_url(href)
-
-            if not self.is_internal_url(normalized):
-                link_type = 'external'
-            elif self.is_pdf(normalized):
-                link_type = 'pdf'
-            else:
-                link_type = 'internal'
+            info = self._classify_link(href)
+            if info is None:
+                continue  # Non-HTTP(S) link (mailto:, tel:, javascript:, etc.)
 
             links.append({
-                'url': normalized,
-                'text': anchor.get_text(strip=True),
-                'type': link_type
+                'url': info.url,
+                'text': ' '.join(''.join(anchor.itertext()).split()),
+                'type': info.type
             })
 
         return links
 
-    def crawl_page(self, url: str, depth: int = 0):
-        """Crawl a single page and follow internal links."""
-        if depth > self.max_depth:
-            return
-
+    async def crawl_page(self, url: str, depth: int = 0):
+        """Crawl a single page and enqueue its internal links."""
         if url in self.visited_urls:
             return
 
@@ -280,36 +446,53 @@ class MunicipalScraper:
         pages_so_far = len(self.pages)
         print(f"[{pages_so_far + 1}] Crawling (depth {depth}): {url}")
         self.visited_urls.add(url)
+        self._log_visit(url, depth)
 
         # Rate limiting
-        time.sleep(self.delay)
+        await self._throttle()
 
-        response = self.fetch_page(url)
-        if not response:
+        fetched = await self.fetch_page(url)
+        if not fetched:
             return
+        content, content_type = fetched
 
         # Check if it's actually HTML
-        content_type = response.headers.get('Content-Type', '')
         if 'text/html' not in content_type:
             print(f"Skipping non-HTML content: {url}")
             return
 
-        soup = BeautifulSoup(response.content, 'lxml')
+        try:
+            tree = lhtml.fromstring(content)
+        except (etree.ParserError, ValueError):
+            print(f"Skipping unparseable page: {url}")
+            return
 
         # Extract title
-        title = soup.title.string if soup.title else url
+        title_tag = tree.find('.//title')
+        title = title_tag.text if title_tag is not None and title_tag.text else url
 
         # Extract links
-        links = self.extract_links(soup, url)
+        links = self.extract_links(tree, url)
 
         # Update total links counter
         self.total_links_found += len(links)
 
-        # Show link counts for this page
-        internal_count = sum(1 for link in links if link['type'] == 'internal')
-        pdf_count = sum(1 for link in links if link['type'] == 'pdf')
-        external_count = sum(1 for link in links if link['type'] == 'external')
-        print(f"  Found {len(links)} links: {internal_count} internal, {pdf_count} PDFs, {external_count} external")
+        # Partition links by type in one pass; every later consumer
+        # (counts, site graph, PDF cataloging, enqueueing) reuses these
+        # instead of rescanning the list
+        internal_urls: List[str] = []
+        pdf_links: List[Dict[str, str]] = []
+        external_count = 0
+        for link in links:
+            link_type = link['type']
+            if link_type == 'internal':
+                internal_urls.append(link['url'])
+            elif link_type == 'pdf':
+                pdf_links.append(link)
+            else:
+                external_count += 1
+
+        print(f"  Found {len(links)} links: {len(internal_urls)} internal, {len(pdf_links)} PDFs, {external_count} external")
         print(f"  [Total so far: {len(self.pages) + 1} pages crawled, {self.total_links_found} links found]")
 
         # Store page data (will be cleaned later)
@@ -318,9 +501,19 @@ class MunicipalScraper:
             'title': title,
             'scraped_at': datetime.utcnow().isoformat(),
             'depth': depth,
-            'html': str(soup),  # Store full HTML for cleaning phase
             'links': links
         }
+
+        # Persist the fetched bytes as a gzip sidecar and keep only its
+        # path in memory: holding every page's HTML for the whole crawl
+        # costs roughly the whole site's size in RSS. The cleaner reads
+        # the sidecar one page at a time via html_file.
+        html_file = self._write_html_incremental(self._url_to_hash(url), content)
+        if html_file is not None:
+            page_data['html_file'] = str(html_file)
+        else:
+            page_data['html'] = content.decode('utf-8', errors='replace')
+
         self.pages.append(page_data)
 
         # Write incrementally if enabled
@@ -331,28 +524,33 @@ class MunicipalScraper:
             self._save_state()
 
         # Build site graph
-        self.site_graph[url] = [link['url'] for link in links if link['type'] == 'internal']
+        self.site_graph[url] = internal_urls
 
-        # Handle PDFs
-        for link in links:
-            if link['type'] == 'pdf':
-                self.catalog_pdf(link['url'], link['text'], url)
+        # Hand PDFs to the dedicated catalog workers
+        for link in pdf_links:
+            self.catalog_pdf(link['url'], link['text'], url)
 
-        # Follow internal links
-        for link in links:
-            if link['type'] == 'internal' and link['url'] not in self.visited_urls:
-                self.crawl_page(link['url'], depth + 1)
+        # Enqueue internal links for the worker pool; the depth limit and
+        # dedup are enforced here so rejected URLs never enter the queue
+        if depth < self.max_depth:
+            for link_url in internal_urls:
+                if self._should_enqueue(link_url):
+                    self._queue.put_nowait((link_url, depth + 1))
 
     def catalog_pdf(self, pdf_url: str, link_text: str, parent_page: str):
-        """Catalog a PDF without downloading the full content."""
-        if any(pdf['url'] == pdf_url for pdf in self.pdfs):
+        """Queue a PDF for cataloging; deduplicated by URL at enqueue time."""
+        if pdf_url in self._pdf_urls:
             return  # Already cataloged
+        self._pdf_urls.add(pdf_url)
+        self._pdf_queue.put_nowait((pdf_url, link_text, parent_page))
 
+    async def _catalog_pdf(self, pdf_url: str, link_text: str, parent_page: str):
+        """Catalog a PDF without downloading the full content."""
         try:
             # HEAD request to get metadata without downloading
-            response = requests.head(pdf_url, timeout=10)
-            file_size = int(response.headers.get('Content-Length', 0))
-            last_modified = response.headers.get('Last-Modified', '')
+            async with self._session.head(pdf_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                file_size = int(response.headers.get('Content-Length', 0))
+                last_modified = response.headers.get('Last-Modified', '')
 
             pdf_data = {
                 'url': pdf_url,
@@ -366,28 +564,115 @@ class MunicipalScraper:
             self.pdfs.append(pdf_data)
             print(f"  [PDF #{len(self.pdfs)}] {link_text} ({pdf_data['file_size_mb']} MB)")
 
-            # Write PDF catalog incrementally
-            self._write_pdfs_incremental()
+            # Mark the catalog dirty; the debounced flush coalesces writes
+            self._schedule_pdf_flush()
 
         except Exception as e:
             print(f"  Error cataloging PDF {pdf_url}: {e}")
 
+    def _schedule_pdf_flush(self):
+        """Flag the PDF catalog dirty and ensure a flush is scheduled."""
+        self._pdfs_dirty = True
+        if self._pdf_flush_task is None or self._pdf_flush_task.done():
+            self._pdf_flush_task = asyncio.create_task(self._flush_pdfs_debounced())
+
+    async def _flush_pdfs_debounced(self):
+        """Write the PDF catalog at most once per flush interval.
+
+        Each new PDF used to rewrite the whole catalog file immediately;
+        coalescing the writes keeps the total bytes written linear in the
+        number of PDFs instead of quadratic.
+        """
+        await asyncio.sleep(self._PDF_FLUSH_INTERVAL)
+        self._pdfs_dirty = False
+        self._write_pdfs_incremental()
+
+    async def _pdf_worker(self):
+        """Pull queued PDFs and HEAD them until cancelled."""
+        while True:
+            pdf_url, link_text, parent_page = await self._pdf_queue.get()
+            try:
+                await self._catalog_pdf(pdf_url, link_text, parent_page)
+            finally:
+                self._pdf_queue.task_done()
+
+    async def _worker(self):
+        """Pull (url, depth) items off the queue until cancelled."""
+        while True:
+            url, depth = await self._queue.get()
+            try:
+                await self.crawl_page(url, depth)
+            except Exception as e:
+                print(f"Error crawling {url}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _crawl(self):
+        """Run the concurrent crawl: one shared session, N worker tasks."""
+        self._queue = asyncio.Queue()
+        self._pdf_queue = asyncio.Queue()
+        self._throttle_lock = asyncio.Lock()
+        self._next_fetch_time = 0.0
+
+        # One shared session for the whole crawl: connections stay open
+        # across requests (keep-alive), so the TCP/TLS handshake is paid
+        # once per connection instead of once per fetch. The pool is
+        # sized so page workers and PDF workers never starve each other.
+        pool_size = self.concurrency + self._PDF_WORKERS
+        connector = aiohttp.TCPConnector(
+            limit=pool_size,
+            limit_per_host=pool_size,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        headers = {
+            'User-Agent': self.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        }
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        async with aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout) as session:
+            self._session = session
+            self._should_enqueue(self.base_url)
+            self._queue.put_nowait((self.base_url, 0))
+
+            workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+            pdf_workers = [asyncio.create_task(self._pdf_worker()) for _ in range(self._PDF_WORKERS)]
+            await self._queue.join()
+            await self._pdf_queue.join()
+
+            for worker in workers + pdf_workers:
+                worker.cancel()
+            await asyncio.gather(*workers, *pdf_workers, return_exceptions=True)
+
+            # Final flush: cancel any pending debounce and write directly
+            if self._pdf_flush_task is not None:
+                self._pdf_flush_task.cancel()
+            if self._pdfs_dirty:
+                self._pdfs_dirty = False
+                self._write_pdfs_incremental()
+
+        self._session = None
+
     def start(self):
         """Start the crawl from the base URL."""
         print(f"Starting crawl of {self.base_url}")
         print(f"Domain: {self.domain} (normalized: {self.normalize_domain(self.domain)})")
-        print(f"Max depth: {self.max_depth}, Delay: {self.delay}s")
+        print(f"Max depth: {self.max_depth}, Delay: {self.delay}s, Concurrency: {self.concurrency}")
         if self.skip_languages:
             print(f"Language filtering: Enabled (skipping non-English versions)")
         if self.output_dir:
             print(f"Incremental writing: Enabled (writing to {self.output_dir})")
         print()
 
-        self.crawl_page(self.base_url, depth=0)
+        asyncio.run(self._crawl())
 
-        # Save final state
+        # Save final state and close the visit log
         if self.output_dir:
             self._save_state()
+            if self._state_log is not None:
+                self._state_log.close()
+                self._state_log = None
             print(f"\n✓ Data saved incrementally to {self.output_dir}")
 
         print(f"\nCrawl complete!")
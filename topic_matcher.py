@@ -0,0 +1,117 @@
+"""
+Numba-accelerated multi-keyword topic matcher for very large catalogs.
+
+Builds a dense Aho-Corasick DFA over the topic keywords as flat NumPy
+tables (goto[state, byte] -> state, mask[state] -> topic bitmask), packs
+every page text into one byte buffer plus an offsets array, and walks the
+whole batch in a parallel @njit kernel. One bit per topic, so up to 64
+topics per matcher.
+
+Numba is optional; callers should check NUMBA_AVAILABLE and keep a
+pure-Python path for when it is not installed.
+"""
+from collections import deque
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _build_tables(topic_keywords: Dict[str, List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the dense DFA tables for the keyword set.
+
+    Returns (goto, masks): goto is int32[states, 256] with failure
+    transitions folded in, masks is int64[states] with each accepting
+    state carrying the OR of its topics' bits (including those reachable
+    via suffix links).
+    """
+    # Trie construction: one dict of byte -> state per node
+    transitions = [{}]
+    masks = [0]
+
+    for bit, (topic, keywords) in enumerate(topic_keywords.items()):
+        for keyword in keywords:
+            state = 0
+            for byte in keyword.encode('utf-8'):
+                next_state = transitions[state].get(byte)
+                if next_state is None:
+                    transitions.append({})
+                    masks.append(0)
+                    next_state = len(transitions) - 1
+                    transitions[state][byte] = next_state
+                state = next_state
+            masks[state] |= 1 << bit
+
+    # BFS over the trie to fold failure links into a full DFA
+    state_count = len(transitions)
+    goto = np.zeros((state_count, 256), dtype=np.int32)
+    fail = [0] * state_count
+
+    queue = deque()
+    for byte, next_state in transitions[0].items():
+        goto[0, byte] = next_state
+        queue.append(next_state)
+
+    while queue:
+        state = queue.popleft()
+        fallback = fail[state]
+        masks[state] |= masks[fallback]
+        for byte in range(256):
+            next_state = transitions[state].get(byte)
+            if next_state is None:
+                goto[state, byte] = goto[fallback, byte]
+            else:
+                goto[state, byte] = next_state
+                fail[next_state] = goto[fallback, byte]
+                queue.append(next_state)
+
+    return goto, np.array(masks, dtype=np.int64)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _scan_pages(buf, offsets, goto, masks, hits):
+        """Walk each page's byte slice through the DFA, OR-ing topic bits."""
+        for i in prange(offsets.shape[0] - 1):
+            state = 0
+            page_mask = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                state = goto[state, buf[j]]
+                page_mask |= masks[state]
+            hits[i] = page_mask
+
+
+class TopicMatcher:
+    """Batch topic matcher over many page texts at once."""
+
+    def __init__(self, topic_keywords: Dict[str, List[str]]):
+        if not NUMBA_AVAILABLE:
+            raise RuntimeError("TopicMatcher requires numba")
+        if len(topic_keywords) > 64:
+            raise ValueError("TopicMatcher supports at most 64 topics")
+        self.topics = list(topic_keywords)
+        self._goto, self._masks = _build_tables(topic_keywords)
+
+    def match(self, texts: List[str]) -> List[Tuple[str, ...]]:
+        """Return the tuple of topics hit by each text, in input order."""
+        encoded = [text.encode('utf-8') for text in texts]
+
+        # Flatten to one buffer + offsets so the kernel sees plain arrays
+        lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+        hits = np.zeros(len(encoded), dtype=np.int64)
+        if len(encoded):
+            _scan_pages(buf, offsets, self._goto, self._masks, hits)
+
+        return [
+            tuple(topic for bit, topic in enumerate(self.topics) if page_mask >> bit & 1)
+            for page_mask in hits
+        ]